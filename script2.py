@@ -1,4 +1,6 @@
+import orjson
 import requests
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 
@@ -6,12 +8,14 @@ import matplotlib.pyplot as plt
 response = requests.get('https://overpass.kumi.systems/api/interpreter?data=[out:json];area(3600032157)->.searchArea;(node["railway"="station"](area.searchArea);way["railway"="subway"](area.searchArea);relation["railway"="subway"](area.searchArea););out;')
 
 # Parsing the JSON response to get the nodes, edges and their attributes
-data = response.json()
+data = orjson.loads(response.content)
 nodes = {}
+node_pos = {}
 edges = []
 for element in data['elements']:
     if element['type'] == 'node':
         nodes[element['id']] = element['tags']['name']
+        node_pos[element['id']] = (element['lon'], element['lat'])
     elif element['type'] == 'way':
         for i in range(len(element['nodes'])-1):
             edges.append((element['nodes'][i], element['nodes'][i+1]))
@@ -23,15 +27,17 @@ for element in data['elements']:
 
 # Creating a networkx graph
 shanghai_metro = nx.Graph()
-shanghai_metro.add_nodes_from(nodes.keys())
-nx.set_node_attributes(shanghai_metro, nodes, 'name')
-for edge in edges:
-    node1 = edge[0]
-    node2 = edge[1]
-    pos1 = (data['elements'][list(nodes.keys()).index(node1)]['lon'], data['elements'][list(nodes.keys()).index(node1)]['lat'])
-    pos2 = (data['elements'][list(nodes.keys()).index(node2)]['lon'], data['elements'][list(nodes.keys()).index(node2)]['lat'])
-    distance = ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
-    shanghai_metro.add_edge(node1, node2, weight=distance)
+shanghai_metro.add_nodes_from((node, {'name': name}) for node, name in nodes.items())
+pos1 = [node_pos[node1] for node1, _ in edges]
+pos2 = [node_pos[node2] for _, node2 in edges]
+
+# Computing all edge lengths in one vectorised pass
+pos1 = np.array(pos1, dtype=float).reshape(-1, 2)
+pos2 = np.array(pos2, dtype=float).reshape(-1, 2)
+distances = np.hypot(pos1[:, 0] - pos2[:, 0], pos1[:, 1] - pos2[:, 1])
+shanghai_metro.add_weighted_edges_from(
+    (node1, node2, float(distance)) for (node1, node2), distance in zip(edges, distances)
+)
 
 # Visualizing the graph
 pos = nx.get_node_attributes(shanghai_metro, 'pos')